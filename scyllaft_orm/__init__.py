@@ -1,13 +1,39 @@
-import os
+import importlib
 
-from .metadata import ApplicationEnvironment, MetaData
-from .query_builder import Delete, Insert, Query, Select, Update
-from .table import ScyllaTable
+# Avoid importing `typing` at runtime, type checkers treat this name as True.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .metadata import ApplicationEnvironment, MetaData
+    from .query_builder import Delete, Insert, Query, Select, Update
+    from .table import ScyllaTable
 
-# NOTE: This might be heavy on startup time
-app_env = os.environ.get("APPLICATION_ENV")
-if app_env:
-    ApplicationEnvironment().set_environment(app_env)
+_LAZY_IMPORTS = {
+    "ApplicationEnvironment": ".metadata",
+    "MetaData": ".metadata",
+    "ScyllaTable": ".table",
+    "Query": ".query_builder",
+    "Select": ".query_builder",
+    "Update": ".query_builder",
+    "Insert": ".query_builder",
+    "Delete": ".query_builder",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import the public objects on first access to keep startup time low."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported objects along with the loaded ones."""
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
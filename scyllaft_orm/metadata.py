@@ -1,5 +1,7 @@
 """General tooling to create table and views."""
 
+import os
+
 from loguru import logger
 from scyllaft import Scylla
 
@@ -18,15 +20,17 @@ class SingletonMeta(type):
         Possible changes to the value of the `__init__` argument do not affect
         the returned instance.
         """
-        if cls not in cls._instances:
+        instance = cls._instances.get(cls)
+        if instance is None:
             instance = super().__call__(*args, **kwargs)
             cls._instances[cls] = instance
-        return cls._instances[cls]
+        return instance
 
 
 class ApplicationEnvironment(metaclass=SingletonMeta):
 
     modified: bool = False
+    _warned: bool = False
     env: str = "dev"
 
     def set_environment(self, env: str) -> None:
@@ -36,15 +40,21 @@ class ApplicationEnvironment(metaclass=SingletonMeta):
 
     def get_environment(self) -> str:
         """Get the application env."""
-        if not self.modified:
+        if not self.modified and not self._warned:
             logger.warning(
                 "Using the default environment : {env}, as the application env has not been set",
                 env=self.env,
             )
+            self._warned = True
 
         return self.env
 
 
+app_env = os.environ.get("APPLICATION_ENV")
+if app_env:
+    ApplicationEnvironment().set_environment(app_env)
+
+
 class MetaData:
     """MetaData class to create all views and tables."""
 
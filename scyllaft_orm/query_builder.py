@@ -3,15 +3,17 @@ from typing import Any
 
 from scyllaft import Scylla
 
-from .tables import ScyllaTable
+from .table import ScyllaTable
 
 
 class Query:
     """Generic query expression."""
 
+    __slots__ = ("_table", "_args")
+
     def __init__(self, table: ScyllaTable) -> None:
         self._table = table
-        self._args = []
+        self._args: list[Any] = []
 
     def execute(self, scylla_instance: Scylla) -> Any:
         pass
@@ -19,24 +21,32 @@ class Query:
     def build_query(self) -> str:
         return ""
 
-    def __str__(self):
+    def __str__(self) -> str:
         return self.build_query()
 
 
 class Select(Query):
     """Select query from scylla."""
 
+    __slots__ = ()
+
 
 class Update(Query):
     """Update query."""
 
+    __slots__ = ()
+
 
 class Delete(Query):
     """Update query."""
 
+    __slots__ = ()
+
 
 class Insert(Query):
     """Insert query.
 
     Suboptimal way to insert, as the "best way" is to batch insert using directly `scyllaft`.
     """
+
+    __slots__ = ()
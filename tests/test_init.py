@@ -0,0 +1,18 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_import_does_not_load_heavy_dependencies():
+    code = (
+        "import sys, scyllaft_orm; "
+        "print(sorted(m for m in ('pydantic', 'loguru', 'scyllaft') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+    )
+    assert result.stdout.strip() == "[]"
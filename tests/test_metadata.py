@@ -0,0 +1,28 @@
+import pytest
+from loguru import logger
+
+from scyllaft_orm.metadata import ApplicationEnvironment, SingletonMeta
+
+
+@pytest.fixture
+def fresh_environment():
+    SingletonMeta._instances.pop(ApplicationEnvironment, None)
+    yield
+    SingletonMeta._instances.pop(ApplicationEnvironment, None)
+
+
+def test_singleton_returns_same_instance(fresh_environment):
+    assert ApplicationEnvironment() is ApplicationEnvironment()
+
+
+def test_default_environment_warns_once(fresh_environment):
+    messages = []
+    sink_id = logger.add(messages.append, level="WARNING")
+    try:
+        env = ApplicationEnvironment()
+        assert env.get_environment() == "dev"
+        assert env.get_environment() == "dev"
+    finally:
+        logger.remove(sink_id)
+
+    assert len(messages) == 1
@@ -0,0 +1,5 @@
+from scyllaft_orm import ScyllaTable, Select
+
+
+def test_select_builds_empty_query():
+    assert str(Select(ScyllaTable())) == ""